@@ -61,6 +61,11 @@ def date(when=None):
         return time.strftime(DATE_FORMAT)
 
 
+# Date shown in plot titles. If set, this is used instead of the current date,
+# so that a batch of plots all show the same date.
+PLOT_DATE = None
+
+
 # Test and plot name format (in regex form)
 NAME_FORMAT = re.compile(r'^[a-zA-Z]\w*$')
 
@@ -118,6 +123,7 @@ from ._io import (  # noqa
     gather_statistics_per_commit,
     generate_report,
     unique_path,
+    write_atomic,
 )
 
 from ._resultsdb import (  # noqa
@@ -127,6 +133,7 @@ from ._resultsdb import (  # noqa
 )
 
 from ._util import (  # noqa
+    effective_sample_size,
     format_date,
     weave,
 )
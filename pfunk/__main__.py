@@ -99,36 +99,40 @@ def run(args):
     pfunk.pintsrepo.prepare_module()
     pfunk.pfunkrepo.prepare_module()
 
+    # Every repeat of every test, as arguments to pfunk.tests.run:
+    # -> [(name1, db, 0), (name1, db, 1), ..., (name2, db, 0), ...]
+    jobs = list(product(names, [args.database], range(args.r)))
+
     # Multi-processing
-    nproc = min(args.r, multiprocessing.cpu_count() - 2)
+    nproc = min(len(jobs), multiprocessing.cpu_count() - 2)
 
     # Run tests
-    for name in names:
-        # Run the test args.r times
-        if nproc > 1:
-            # Run in parallel
-            with multiprocessing.Pool(processes=nproc) as pool:
-                print(f'Running {name} {args.r} times with {nproc} processes:',
-                      flush=True)
-
-                # Starmap with product of name and
-                # range: -> [(name, 0), (name, 1), ...]
-                pool.starmap(
-                    pfunk.tests.run,
-                    product([name], [args.database], range(args.r))
-                )
-        else:
-            # Run without multiprocessing
-            print(f'Running {name} {args.r} times without multiprocessing')
-            for i in range(args.r):
-                pfunk.tests.run(name, args.database, i)
+    if nproc > 1:
+        # Run in parallel, using a single pool for all tests so that the
+        # workers stay busy when a pattern matches several tests. A chunk size
+        # of 1 balances the load, as run times differ greatly between tests.
+        with multiprocessing.Pool(processes=nproc) as pool:
+            print(f'Running {len(names)} test(s) {args.r} times with {nproc}'
+                  ' processes:', flush=True)
+            pool.starmap(pfunk.tests.run, jobs, chunksize=1)
+    else:
+        # Run without multiprocessing
+        print(f'Running {len(names)} test(s) {args.r} times without'
+              ' multiprocessing')
+        for job in jobs:
+            pfunk.tests.run(*job)
 
+    for name in names:
         if args.analyse:
             print('Analysing ' + name + ' ... ', end='')
             result = pfunk.tests.analyse(name, args.database)
             print('ok' if result else 'FAIL')
 
         if args.plot or args.show:
+            # Show the same date on all plots
+            if pfunk.PLOT_DATE is None:
+                pfunk.PLOT_DATE = pfunk.date()
+
             print('Creating plot for ' + name)
             pfunk.tests.plot(name, args.database, args.show)
 
@@ -139,6 +143,9 @@ def plot(args):
     """
     Creates a plot for one or all tests.
     """
+    # Show the same date on all plots
+    pfunk.PLOT_DATE = pfunk.date()
+
     # Make plots
     if args.name:
         for name in _parse_pattern(args.name):
@@ -256,6 +263,7 @@ def investigate(args):
             print(f'RUN FAILED FOR COMMIT {commit}')
 
     # Analyse results
+    pfunk.PLOT_DATE = pfunk.date()
     for name in names:
         pfunk.tests.plot(name, args.database, args.show)
 
@@ -11,7 +11,6 @@ import numpy as np
 import os
 import re
 import time
-from scipy import stats
 
 import pfunk
 
@@ -22,21 +21,44 @@ FLOAT_FORMAT = '{: .17e}'
 RESULT_KEY = re.compile(r'^[a-zA-Z]\w*$')
 
 
-def unique_path(path):
+def unique_path(path, taken=()):
     """
     Returns a unique path equal or similar to the given one.
+
+    Any paths in ``taken`` are treated as if they already exist.
     """
-    if not os.path.exists(path):
+    def exists(path):
+        return path in taken or os.path.exists(path)
+
+    if not exists(path):
         return path
     base, ext = os.path.splitext(path)
     base += '-'
     i = 2
-    while os.path.exists(path):
+    while exists(path):
         path = base + str(i) + ext
         i += 1
     return path
 
 
+def write_atomic(path, data):
+    """
+    Writes the bytes in ``data`` to ``path``, via a temporary file
+    ``path + '.part'`` in the same directory, so that a partially written file
+    is never visible at ``path``.
+    """
+    # Created like open() would, so that the umask determines the permissions
+    temp = path + '.part'
+    fd = os.open(temp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(temp, path)
+    except BaseException:
+        os.remove(temp)
+        raise
+
+
 def clean_filename(filename):
     """ Tidies up a filename and returns it. """
     filename = str(filename)  # Separate line for nicer debugging if this fails
@@ -58,7 +80,7 @@ def find_test_plots():
     root = pfunk.DIR_PLOT
     if not os.path.isdir(root):
         log = logging.getLogger(__name__)
-        log.warning('Path to plots is not a directory: ' + root)
+        log.warning('Path to plots is not a directory: %s', root)
         return plots, dates
 
     # Find all plot files
@@ -166,12 +188,6 @@ def gather_statistics_per_commit(
     if n is not None:
         unique = unique[-n:]
         values = values[-n:]
-        cut_off = 0
-        for i, x in enumerate(commits):
-            if x not in unique:
-                cut_off = i
-        commits = commits[cut_off:]
-        scores = scores[cut_off:]
 
     # Convert to short commit names
     def shorten(commit):
@@ -180,10 +196,10 @@ def gather_statistics_per_commit(
 
     if short_names:
         unique = [shorten(x) for x in unique]
-        commits = [shorten(x) for x in commits]
 
     # Remove outliers
     if remove_outliers:
+        from scipy import stats
         r = 2
         for i in range(len(values)):
             y = np.array(values[i])
@@ -339,8 +355,8 @@ def generate_badge(failed=False):
     if not os.path.isdir(pfunk.DIR_PLOT):
         log = logging.getLogger(__name__)
         log.warning(
-            'Unable to create badge: path to plots is not a directory: '
-            + pfunk.DIR_PLOT)
+            'Unable to create badge: path to plots is not a directory: %s',
+            pfunk.DIR_PLOT)
         return
 
     # Plot location, relative to file
@@ -154,25 +154,36 @@ class ResultsDatabaseWriter(ResultsDatabaseSchemaClient):
         return self._row
 
     def __setitem__(self, key, value):
-        if key in self.primary_columns:
-            # don't update these
-            pass
-        elif key in self.columns:
-            self._connection.execute(
-                f'update test_results set {key} = ? where identifier = ?',
-                (value, self._row))
-            self._connection.commit()
-        else:
-            dictionary = self.json_values()
-            # workaround: if we're given a numpy array, make a Python list
-            if getattr(value, 'tolist', None) is not None:
-                value = value.tolist()
-            dictionary[key] = value
+        self.update({key: value})
+
+    def update(self, values):
+        """
+        Stores all key-value pairs in the dictionary ``values``, using a single
+        transaction (and reading and writing the JSON column at most once).
+        :return: None.
+        """
+        dictionary = None
+        for key, value in values.items():
+            if key in self.primary_columns:
+                # don't update these
+                pass
+            elif key in self.columns:
+                self._connection.execute(
+                    f'update test_results set {key} = ? where identifier = ?',
+                    (value, self._row))
+            else:
+                if dictionary is None:
+                    dictionary = self.json_values()
+                # workaround: if we're given a numpy array, make a Python list
+                if getattr(value, 'tolist', None) is not None:
+                    value = value.tolist()
+                dictionary[key] = value
+        if dictionary is not None:
             json_field = json.dumps(dictionary)
             self._connection.execute(
                 'update test_results set json = ? where identifier = ?',
                 (json_field, self._row))
-            self._connection.commit()
+        self._connection.commit()
 
     def write(self):
         """
@@ -194,11 +205,15 @@ class ResultsDatabaseWriter(ResultsDatabaseSchemaClient):
 class ResultsDatabaseReader(ResultsDatabaseSchemaClient):
     """
     Provides read access to a row in the test results database.
+
+    The JSON column is read and parsed once, on first access, and then kept in
+    memory.
     """
 
     def __init__(self, connection, row_id):
         self._connection = connection
         self._row = row_id
+        self._json = None
 
     def __getitem__(self, item):
         if item in self.primary_columns or item in self.columns:
@@ -210,8 +225,9 @@ class ResultsDatabaseReader(ResultsDatabaseSchemaClient):
                 raise KeyError(
                     f'row_id {self._row} is not present in the database')
             return database_row[0]
-        dictionary = defaultdict(lambda: None, self.json_values())
-        return dictionary[item]
+        if self._json is None:
+            self._json = defaultdict(lambda: None, self.json_values())
+        return self._json[item]
 
 
 class ResultsDatabaseResultsSet(object):
@@ -219,13 +235,21 @@ class ResultsDatabaseResultsSet(object):
     Represents a collection of rows in the test results database. Provides
     keyed access to the fields in the results, so set['foo'] gives you a list
     of the 'foo' fields for all of the results in the set.
+
+    Each field is read from the database once, and then cached: a set is
+    typically accessed several times while plotting and analysing a test.
     """
 
     def __init__(self, result_rows):
         self._rows = result_rows
+        self._cache = {}
 
     def get_single_item(self, item):
-        return [r[item] for r in self._rows]
+        try:
+            values = self._cache[item]
+        except KeyError:
+            values = self._cache[item] = [r[item] for r in self._rows]
+        return list(values)
 
     def __getitem__(self, item):
         # Treat single-value case like multi-value case
@@ -8,7 +8,9 @@
 #
 import os
 
+import concurrent.futures
 import glob
+import io
 import logging
 import numpy as np
 import pfunk
@@ -51,7 +53,7 @@ class FunctionalTest(object):
 
         # Create logger for _global_ console/file output
         log = logging.getLogger(__name__)
-        log.info('Running analyse: ' + self.name())
+        log.info('Running analyse: %s', self.name())
 
         # Load test results
         results = pfunk.find_test_results(self._name, database)
@@ -61,13 +63,13 @@ class FunctionalTest(object):
         try:
             result = self._analyse(results)
         except Exception:
-            log.error('Exception in analyse: ' + self.name())
+            log.error('Exception in analyse: %s', self.name())
             raise
         finally:
             if result:
-                log.info('Test ' + self.name() + ' has passed')
+                log.info('Test %s has passed', self.name())
             else:
-                log.info('Test ' + self.name() + ' has failed')
+                log.info('Test %s has failed', self.name())
 
         # Return
         return result
@@ -105,7 +107,7 @@ class FunctionalTest(object):
         """
         # Create logger for _global_ console/file output
         log = logging.getLogger(__name__)
-        log.info('Running plot: ' + self.name())
+        log.info('Running plot: %s', self.name())
 
         # Load test results
         results = pfunk.find_test_results(self._name, database)
@@ -114,7 +116,7 @@ class FunctionalTest(object):
         try:
             figs = self._plot(results)
         except Exception:
-            log.error('Exception in plot: ' + self.name())
+            log.error('Exception in plot: %s', self.name())
             raise
 
         # Ensure the plots directory exists, or script will fail on fig.savefig
@@ -125,34 +127,42 @@ class FunctionalTest(object):
 
         # Delete existing files
         generated = []
-        mask = self.name() + '*.svg'
-        # Delete old figures
-        for path in glob.glob(os.path.join(pfunk.DIR_PLOT, mask)):
-            path = os.path.realpath(path)
-            if not path.startswith(pfunk.DIR_PLOT):
+        mask = self.name() + '*.svg*'
+        # Delete old figures (and any partially written .svg.part files)
+        for old in glob.glob(os.path.join(pfunk.DIR_PLOT, mask)):
+            old = os.path.realpath(old)
+            if not old.startswith(pfunk.DIR_PLOT):
                 break
             try:
-                os.remove(path)
-                log.info('Removed old plot: ' + path)
+                os.remove(old)
+                log.info('Removed old plot: %s', old)
             except IOError:
-                log.info('Removal of old plot failed: ' + path)
+                log.info('Removal of old plot failed: %s', old)
 
-        # Store
+        # Assume that the user returns an iterable object containing figures,
+        # and if not, that the user returns a single figure
         try:
-            # Assume that the user returns an iterable object containing
-            # figures
-            for i, fig in enumerate(figs):
+            figs = list(figs)
+        except TypeError:
+            figs = [figs]
+
+        # Store: figures are rendered to SVG one at a time on this thread; only
+        # writing the rendered bytes to disk overlaps with the next render
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as pool:
+            writes = []
+            for fig in figs:
                 plot_path = pfunk.unique_path(
-                    os.path.join(pfunk.DIR_PLOT, path))
-                log.info('Storing plot: ' + plot_path)
-                fig.savefig(plot_path)
+                    os.path.join(pfunk.DIR_PLOT, path), generated)
+                log.info('Storing plot: %s', plot_path)
+                buf = io.BytesIO()
+                fig.savefig(buf, format='svg')
+                writes.append(
+                    pool.submit(pfunk.write_atomic, plot_path, buf.getvalue()))
                 generated.append(plot_path)
-        except TypeError:
-            # If not, then assume that the user returns a single figure
-            plot_path = pfunk.unique_path(os.path.join(pfunk.DIR_PLOT, path))
-            log.info('Storing plot: ' + plot_path)
-            figs.savefig(plot_path)
-            generated.append(plot_path)
+
+            # Wait for all writes, raising any errors
+            for write in writes:
+                write.result()
 
         # Close all figures
         import matplotlib.pyplot as plt
@@ -178,7 +188,7 @@ class FunctionalTest(object):
         """
         # Log status
         log = logging.getLogger(__name__)
-        log.info(f'Running test: {self._name} run {run_number}')
+        log.info('Running test: %s run %s', self._name, run_number)
 
         # Seed numpy random generator, so that we know the value
         max_uint32 = np.iinfo(np.uint32).max
@@ -197,20 +207,22 @@ class FunctionalTest(object):
 
         # Create result writer
         with self._writer_generator(name, date, path) as w:
-            w['status'] = 'uninitialised'
-            w['date'] = date
-            w['name'] = name
-            w['python'] = pfunk.PYTHON_VERSION
-            w['pints'] = pfunk.PINTS_VERSION
-            w['pints_commit'] = pfunk.PINTS_COMMIT
-            w['pints_authored_date'] = pfunk.PINTS_COMMIT_AUTHORED
-            w['pints_committed_date'] = pfunk.PINTS_COMMIT_COMMITTED
-            w['pints_commit_msg'] = pfunk.PINTS_COMMIT_MESSAGE
-            w['pfunk_commit'] = pfunk.PFUNK_COMMIT
-            w['pfunk_authored_date'] = pfunk.PFUNK_COMMIT_AUTHORED
-            w['pfunk_committed_date'] = pfunk.PFUNK_COMMIT_COMMITTED
-            w['pfunk_commit_msg'] = pfunk.PFUNK_COMMIT_MESSAGE
-            w['seed'] = seed
+            w.update({
+                'status': 'uninitialised',
+                'date': date,
+                'name': name,
+                'python': pfunk.PYTHON_VERSION,
+                'pints': pfunk.PINTS_VERSION,
+                'pints_commit': pfunk.PINTS_COMMIT,
+                'pints_authored_date': pfunk.PINTS_COMMIT_AUTHORED,
+                'pints_committed_date': pfunk.PINTS_COMMIT_COMMITTED,
+                'pints_commit_msg': pfunk.PINTS_COMMIT_MESSAGE,
+                'pfunk_commit': pfunk.PFUNK_COMMIT,
+                'pfunk_authored_date': pfunk.PFUNK_COMMIT_AUTHORED,
+                'pfunk_committed_date': pfunk.PFUNK_COMMIT_COMMITTED,
+                'pfunk_commit_msg': pfunk.PFUNK_COMMIT_MESSAGE,
+                'seed': seed,
+            })
             results_id = w.row_id()
 
         # Run test
@@ -218,11 +230,10 @@ class FunctionalTest(object):
         try:
             self._run(results)
         except Exception:
-            log.error('Exception in test: ' + self.name())
+            log.error('Exception in test: %s', self.name())
             results['status'] = 'failed'
             raise
         finally:
-            log.info('Writing result to ' + path)
+            log.info('Writing result to %s', path)
             with self._writer_generator(name, date, path, results_id) as w:
-                for k in results.keys():
-                    w[k] = results[k]
+                w.update(results)
@@ -12,6 +12,39 @@ import time
 import pfunk
 
 
+def effective_sample_size(samples):
+    """
+    Calculates the effective sample size of every parameter in a 2d array of
+    ``samples``, and returns them as a list.
+
+    This uses the same estimator as ``pints.effective_sample_size``, which sums
+    the autocorrelation up to the first negative lag, but the autocorrelation
+    is calculated with FFTs in ``O(n log n)`` time, instead of ``O(n^2)`` time,
+    for ``n`` samples.
+    """
+    samples = np.asarray(samples)
+    try:
+        n_samples, n_params = samples.shape
+    except ValueError:
+        raise ValueError('Samples must be given as a 2d array.')
+    if n_samples < 2:
+        raise ValueError('At least two samples must be given.')
+
+    # Normalised autocorrelation for lags 0 to n_samples - 1, zero-padding the
+    # FFT so that the series doesn't wrap around onto itself
+    x = samples - np.mean(samples, axis=0)
+    x /= np.std(samples, axis=0) * np.sqrt(n_samples)
+    f = np.fft.rfft(x, n=2 * n_samples, axis=0)
+    rho = np.fft.irfft(f * np.conj(f), n=2 * n_samples, axis=0)[:n_samples]
+
+    ess = []
+    for r in rho.T:
+        negative = np.flatnonzero(r < 0)
+        t = negative[0] if len(negative) else n_samples
+        ess.append(n_samples / (1 + 2 * np.sum(r[:t])))
+    return ess
+
+
 def format_date(seconds_since_epoch):
     return time.strftime(
         pfunk.DATE_FORMAT, time.gmtime(seconds_since_epoch))
@@ -35,9 +68,6 @@ def weave(chains):
         ...
 
     """
-    # This method is fast, it seems:
-    # https://stackoverflow.com/questions/5347065
-
     # Handle trivial cases
     nc = len(chains)
     if nc == 0:
@@ -57,10 +87,9 @@ def weave(chains):
                 'All chains must have same shape (error for chain ' + str(i)
                 + ').')
 
-    # Create single interwoven chain
+    # Create single interwoven chain: stacking along a new second axis puts
+    # sample j of every chain next to each other, so that a reshape (making
+    # a single contiguous copy) gives the woven chain
     nr, nd = shape
-    woven = np.zeros(((nr * nc), nd))
-    for i, chain in enumerate(chains):
-        woven[i::nc] = chain
-    return woven
+    return np.stack(chains, axis=1).reshape(nr * nc, nd)
 
@@ -7,7 +7,6 @@
 #  functional testing software package.
 #
 import numpy as np
-import ruptures as rpt
 
 class ChangePints:
     """
@@ -34,6 +33,7 @@ class ChangePints:
 
         :param source: timeseries array
         """
+        import ruptures as rpt
         self._signal = np.array(source).flatten()
         algo = rpt.Pelt(model=self._model).fit(self._signal)
         self._bkpts = algo.predict(pen=self._penalty)
@@ -73,5 +73,6 @@ class ChangePints:
 
         :rtype: :class:`matplotlib.figure.Figure`
         """
+        import ruptures as rpt
         fig, ax = rpt.display(self._signal, self.breakpoints())
         return fig
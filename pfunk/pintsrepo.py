@@ -69,7 +69,7 @@ def checkout(checkout):
     Checks out a specific commit, branch, or tree.
     """
     log = logging.getLogger(__name__)
-    log.info('Checking out ' + str(checkout))
+    log.info('Checking out %s', checkout)
 
     # Check out requested commit, branch or tree
     repo = git.Repo(pfunk.DIR_PINTS_REPO)
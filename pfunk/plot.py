@@ -10,11 +10,73 @@ import numpy as np
 
 import matplotlib
 matplotlib.use('Agg')
+matplotlib.rcParams.update({
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+    'agg.path.chunksize': 10000,
+})
 import matplotlib.pyplot as plt
 
 import pfunk
 
 
+def _commit_positions(commits, unique):
+    """
+    Returns the index in ``unique`` of every entry in ``commits``, as an array
+    of floats.
+
+    The entries in ``unique`` are ordered by date, not by name, so they are
+    sorted once here before being searched.
+    """
+    commits = np.asarray(commits)
+    unique = np.asarray(unique)
+    order = np.argsort(unique, kind='stable')
+    return order[np.searchsorted(unique[order], commits)].astype(float)
+
+
+def _commits(ax, statistics, ylabel, threshold=None, zoom=False):
+    """
+    Draws a variable per commit on the axes ``ax``, and returns the largest
+    finite value that was drawn (or 1 if there were none).
+
+    Parameters
+    ----------
+    ax : matplotlib.axes.Axes
+        The axes to draw on.
+    statistics : tuple
+        The output of :meth:`pfunk.gather_statistics_per_commit`.
+    ylabel : str
+        A y-axis label
+    threshold : float
+        An optional pass/fail threshold: if given, a horizontal line will be
+        drawn at this value.
+    zoom : boolean
+        If set to ``True``, the threshold is only drawn if it doesn't change
+        the zoom.
+    """
+    r = 0.3
+
+    ax.set_ylabel(ylabel)
+    ax.set_xlabel('Commit')
+    x, y, u, m, s = statistics
+    if len(x) == 0:
+        ax.text(0.5, 0.5, 'No data')
+        return 1
+
+    x = _commit_positions(x, u)
+    x += np.random.uniform(-r, r, x.shape)
+    ax.plot(u, m, 'ko-', alpha=0.5)
+    ax.scatter(x, y, marker='x', alpha=0.75, rasterized=True)
+    if threshold:
+        # When zoomed, show threshold line only if it doesn't change the zoom
+        if not zoom or (threshold <= np.max(y) and threshold >= np.min(y)):
+            ax.axhline(threshold)
+
+    y = np.array(y)
+    y = y[np.isfinite(y)]
+    return np.max(y) if len(y) else 1
+
+
 def variable(results, variable, title, ylabel, threshold=None):
     """
     Creates and returns a default plot for a variable vs commits.
@@ -33,64 +95,34 @@ def variable(results, variable, title, ylabel, threshold=None):
         An optional pass/fail threshold: if given, a horizontal line will be
         drawn at this value.
     """
-    fig = plt.figure(figsize=(11, 4.5))
-    plt.suptitle(title + ' : ' + pfunk.date())
+    statistics = pfunk.gather_statistics_per_commit(results, variable)
 
-    r = 0.3
+    # No data at all? Then skip creating and formatting the axes
+    if len(statistics[0]) == 0:
+        fig = plt.figure(figsize=(11, 4.5))
+        fig.suptitle(title + ' : ' + (pfunk.PLOT_DATE or pfunk.date()))
+        fig.text(0.5, 0.5, 'No data', ha='center')
+        return fig
+
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(11, 4.5))
+    fig.suptitle(title + ' : ' + (pfunk.PLOT_DATE or pfunk.date()))
 
     # Left plot: Variable per commit, all data
-    plt.subplot(1, 2, 1)
-    plt.ylabel(ylabel)
-    plt.xlabel('Commit')
-    fig.autofmt_xdate()
-    x, y, u, m, s = pfunk.gather_statistics_per_commit(results, variable)
-    if len(x) == 0:
-        plt.text(0.5, 0.5, 'No data')
-    else:
-        xlookup = dict(zip(u, np.arange(len(u))))
-        x = np.array([xlookup[i] for i in x], dtype=float)
-        x += np.random.uniform(-r, r, x.shape)
-        plt.plot(u, m, 'ko-', alpha=0.5)
-        plt.plot(x, y, 'x', alpha=0.75)
-        if threshold:
-            plt.axhline(threshold)
-        try:
-            y = np.array(y)
-            ymax = np.max(y[np.isfinite(y)])
-        except ValueError:
-            ymax = 1
+    ymax1 = _commits(ax1, statistics, ylabel, threshold)
 
     # Right plot: Same, but with outliers removed, to achieve a "zoom" on the
     # most common, recent data.
-    plt.subplot(1, 2, 2)
-    plt.ylabel(ylabel)
-    plt.xlabel('Commit')
+    ymax2 = _commits(
+        ax2,
+        pfunk.gather_statistics_per_commit(
+            results, variable, remove_outliers=True, n=10),
+        ylabel, threshold, zoom=True)
+
     fig.autofmt_xdate()
-    x, y, u, m, s = pfunk.gather_statistics_per_commit(
-        results, variable, remove_outliers=True, n=10)
-    if len(x) == 0:
-        plt.text(0.5, 0.5, 'No data')
+    if max(ymax1, ymax2) > 1000:
+        fig.subplots_adjust(0.1, 0.16, 0.99, 0.92, 0.2, 0)
     else:
-        xlookup = dict(zip(u, np.arange(len(u))))
-        x = np.array([xlookup[i] for i in x], dtype=float)
-        x += np.random.uniform(-r, r, x.shape)
-        plt.plot(u, m, 'ko-', alpha=0.5)
-        plt.plot(x, y, 'x', alpha=0.75)
-        if threshold:
-            # Show threshold line only if it doesn't change the zoom
-            if threshold <= np.max(y) and threshold >= np.min(y):
-                plt.axhline(threshold)
-        y = np.array(y)
-        try:
-            y = np.array(y)
-            ymax = max(ymax, np.max(y[np.isfinite(y)]))
-        except ValueError:
-            pass
-
-        if ymax > 1000:
-            plt.subplots_adjust(0.1, 0.16, 0.99, 0.92, 0.2, 0)
-        else:
-            plt.subplots_adjust(0.07, 0.16, 0.99, 0.92, 0.17, 0)
+        fig.subplots_adjust(0.07, 0.16, 0.99, 0.92, 0.17, 0)
 
     return fig
 
@@ -49,7 +49,7 @@ class MCMCNormal(pfunk.FunctionalTest):
         DEBUG = False
 
         # Show method name
-        log.info('Using method: ' + self._method)
+        log.info('Using method: %s', self._method)
 
         # Get method class
         method = getattr(pints, self._method)
@@ -109,14 +109,15 @@ class MCMCNormal(pfunk.FunctionalTest):
         # For multi-chain, multiply by n_chains because we wove the chains
         # together.
         chain = chain[n_burn * self._nchains:]
-        log.info('Chain shape (without burn-in): ' + str(chain.shape))
-        log.info('Chain mean: ' + str(np.mean(chain, axis=0)))
+        log.info('Chain shape (without burn-in): %s', chain.shape)
+        if log.isEnabledFor(logging.INFO):
+            log.info('Chain mean: %s', np.mean(chain, axis=0))
 
         # Store kullback-leibler divergence after burn-in
         result['kld'] = log_pdf.kl_divergence(chain)
 
         # Store effective sample size
-        result['ess'] = pints.effective_sample_size(chain)
+        result['ess'] = pfunk.effective_sample_size(chain)
 
         # Store status
         result['status'] = 'done'
@@ -127,6 +128,8 @@ class MCMCNormal(pfunk.FunctionalTest):
 
     def _plot(self, results):
 
+        import pfunk.plot
+
         figs = []
 
         # Figure: KL per commit
@@ -58,7 +58,7 @@ class NestedBanana(pfunk.FunctionalTest):
         DEBUG = False
 
         # Show method name
-        log.info('Using method: ' + self._method)
+        log.info('Using method: %s', self._method)
 
         # Get method class
         method = getattr(pints, self._method)
@@ -96,6 +96,8 @@ class NestedBanana(pfunk.FunctionalTest):
 
     def _plot(self, results):
 
+        import pfunk.plot
+
         figs = []
 
         # Figure: KL per commit
@@ -48,7 +48,7 @@ class NestedEggBox(pfunk.FunctionalTest):
         DEBUG = False
 
         # Show method name
-        log.info('Using method: ' + self._method)
+        log.info('Using method: %s', self._method)
 
         # Get method class
         method = getattr(pints, self._method)
@@ -89,6 +89,8 @@ class NestedEggBox(pfunk.FunctionalTest):
 
     def _plot(self, results):
 
+        import pfunk.plot
+
         figs = []
 
         # Figure: KL per commit
@@ -129,6 +129,8 @@ class Optimisation(pfunk.FunctionalTest):
 
     def _plot(self, results):
 
+        import pfunk.plot
+
         figs = []
 
         #
@@ -249,9 +251,9 @@ class OptimisationBR(Optimisation):
         times = model.suggested_times()
         values = model.simulate(xtrue, times)
 
-        # Add noise
-        values[:, 0] += np.random.normal(0, 1, values[:, 0].shape)
-        values[:, 1] += np.random.normal(0, 5e-7, values[:, 1].shape)
+        # Add noise, with a different sigma for each output. The noise is
+        # drawn one output (column) at a time, as in separate calls.
+        values += np.random.normal(0, [[1], [5e-7]], values.T.shape).T
 
         # Create problem and a weighted score function
         problem = pints.MultiOutputProblem(model, times, values)
@@ -25,11 +25,10 @@ def upload_results():
 
     # Call the synchronisation script in a subprocess
     cmd = [pfunk.PATH_WEB_SYNC_SCRIPT]
+    # (On interrupt, subprocess.run kills the script before re-raising)
     try:
-        p = subprocess.Popen(cmd, cwd=pfunk.DIR_WEB_REPO)
-        p.wait()
+        p = subprocess.run(cmd, cwd=pfunk.DIR_WEB_REPO)
     except KeyboardInterrupt:
-        p.terminate()
         log.error('Uploading aborted by user')
         return
 
@@ -47,7 +46,18 @@ def _refresh_repo():
     log.info('Checkout out master')
     repo.git.checkout('master')
 
-    log.info('Perfoming git pull')
-    log.info(repo.git.pull())
+    tracking = repo.active_branch.tracking_branch()
+    if tracking is None:
+        raise Exception(
+            'Website repo branch master has no upstream branch to pull from.')
+
+    log.info('Fetching %s', tracking.remote_name)
+    repo.remote(tracking.remote_name).fetch()
+    if repo.head.commit == tracking.commit:
+        log.info('Website repo up-to-date, skipping merge')
+        return
+
+    log.info('Merging %s', tracking.name)
+    log.info(repo.git.merge('--ff-only', tracking.name))
     log.info(repo.git.status())
 